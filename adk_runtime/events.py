@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 import hashlib
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -11,11 +11,14 @@ from .paths import EVENTS_FILE, ensure_runtime_dirs
 
 SCHEMA_VERSION = "1.0"
 
+# Built once: json.dumps() with non-default kwargs constructs a new encoder per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 def utc_ts_iso() -> str:
-    # UTC, RFC3339-ish with milliseconds, always ends with Z
-    dt = datetime.now(timezone.utc)
-    return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    # UTC, RFC3339-ish with milliseconds, always ends with Z (time_ns/gmtime, no datetime object)
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}.{ns // 1_000_000:03d}Z"
 
 
 def canonical_json(obj: Any) -> str:
@@ -25,7 +28,7 @@ def canonical_json(obj: Any) -> str:
     - no whitespace
     - ensure_ascii=False (stable for unicode)
     """
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 def sha256_hex(s: str) -> str:
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional
 
 from .event_ledger import EventLedger
 from .memory_schema import MemoryZone
-from .paths import RUNTIME_DATA_DIR, ensure_runtime_dirs
+from .paths import MEMORY_GATE_LEDGER_FILE, ensure_runtime_dirs
 
 
 @dataclass(frozen=True)
@@ -202,7 +202,6 @@ class P08MemoryGate:
 
 def make_p08_gate(legacy_store_module) -> P08MemoryGate:
     ensure_runtime_dirs()
-    ledger_path = RUNTIME_DATA_DIR / "memory_gate_ledger.jsonl"
-    ledger = EventLedger(ledger_path)
+    ledger = EventLedger(MEMORY_GATE_LEDGER_FILE)
     runtime = RuntimeSchema()
     return P08MemoryGate(legacy_store_module, ledger, runtime)
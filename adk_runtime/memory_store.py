@@ -19,6 +19,9 @@ DEFAULT_MEMORY: Dict[str, Any] = {
     },
 }
 
+# P07 v0 allow-list, checked with a single str.startswith(tuple) call.
+_ALLOWLIST_KEY_PREFIXES = ("notes.", "observations.")
+
 
 def _policy_check_write_proposal(proposal: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -41,7 +44,7 @@ def _policy_check_write_proposal(proposal: Dict[str, Any]) -> Dict[str, Any]:
             "reason": "P07 v0: memory writes require an explicit key.",
             "policy_version": "policy_gate_v0",
         }
-    if key.startswith("notes.") or key.startswith("observations."):
+    if key.startswith(_ALLOWLIST_KEY_PREFIXES):
         return {
             "proposal_id": proposal["proposal_id"],
             "decision": "allowed",
@@ -1,10 +1,14 @@
 # adk_runtime/observability.py
 from __future__ import annotations
+import contextvars
 import json
+import sys
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 from .paths import EVENTS_FILE, RUNTIME_DATA_DIR, ensure_runtime_dirs, get_log_file
 from .events import EventWriter  # ✅ P04：统一信封写入口
@@ -15,6 +19,12 @@ from . import trace_context
 OBS_DIR = RUNTIME_DATA_DIR / "observability"
 OBS_EVENTS_FILE = OBS_DIR / "observability_events.jsonl"
 
+# Reused encoder (same output as json.dumps(..., ensure_ascii=False)).
+_encode_line = json.JSONEncoder(ensure_ascii=False).encode
+
+# Pending lines per ledger file while inside event_batch(); None = write-through.
+_batch_var: contextvars.ContextVar[Dict[Path, List[str]] | None] = contextvars.ContextVar("obs_batch", default=None)
+
 
 def _iso_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -25,6 +35,54 @@ def _now_human() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+def _append_line(path: Path, line: str) -> None:
+    pending = _batch_var.get()
+    if pending is not None:
+        pending.setdefault(path, []).append(line)
+        return
+    with path.open("a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _flush_batch(pending: Dict[Path, List[str]]) -> Exception | None:
+    # One append per ledger file; a failing file is reported and does not stop the others.
+    first_error: Exception | None = None
+    for path, lines in pending.items():
+        try:
+            with path.open("a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            print(f"[observability] event_batch flush failed for {path}: {e!r}", file=sys.stderr)
+            if first_error is None:
+                first_error = e
+    return first_error
+
+
+@contextmanager
+def event_batch() -> Iterator[None]:
+    """
+    Buffer emit_event/log_event lines and append them with one write per
+    ledger file when the block exits (also on error, so nothing is lost).
+    Nested batches join the outermost one. If the block raises, that error
+    propagates and flush failures are only reported on stderr.
+    """
+    if _batch_var.get() is not None:
+        yield
+        return
+    pending: Dict[Path, List[str]] = {}
+    token = _batch_var.set(pending)
+    try:
+        yield
+    except BaseException:
+        _batch_var.reset(token)
+        _flush_batch(pending)
+        raise
+    _batch_var.reset(token)
+    error = _flush_batch(pending)
+    if error is not None:
+        raise error
+
+
 def new_trace_id() -> str:
     return str(uuid.uuid4())
 
@@ -91,9 +149,8 @@ def emit_event(
             payload = dict(payload)
             payload.setdefault("latency_ms", latency_ms)
         record["payload"] = payload
-    line = json.dumps(record, ensure_ascii=False)
-    with OBS_EVENTS_FILE.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    line = _encode_line(record)
+    _append_line(OBS_EVENTS_FILE, line + "\n")
 
 
 def span_start(event_type: str, run_id: str, *, layer: Optional[str] = None, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -181,6 +238,4 @@ def log_event(
     )
 
     # ✅ 同时写一份人类可读日志（MVP 保留）
-    log_file = get_log_file()
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(f"[{_now_human()}] {event_type} ({source}) {payload}\n")
+    _append_line(get_log_file(), f"[{_now_human()}] {event_type} ({source}) {payload}\n")
@@ -12,6 +12,7 @@ PROJECTS_DIR: Path = REPO_ROOT / "projects"
 RUNTIME_DATA_DIR: Path = REPO_ROOT / "runtime_data"
 LOGS_DIR: Path = RUNTIME_DATA_DIR / "logs"
 EVENTS_FILE: Path = RUNTIME_DATA_DIR / "events.jsonl"
+MEMORY_GATE_LEDGER_FILE: Path = RUNTIME_DATA_DIR / "memory_gate_ledger.jsonl"
 MEMORY_STORE_FILE: Path = RUNTIME_DATA_DIR / "memory_store.json"
 GLOBAL_PERSONA_FILE: Path = REPO_ROOT / "persona.json"
 
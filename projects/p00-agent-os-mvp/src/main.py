@@ -1,6 +1,6 @@
 # projects/p00-agent-os-mvp/src/main.py
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime, timezone
 
 from adk_runtime import memory_store as legacy_memory_store
@@ -8,8 +8,8 @@ from adk_runtime.event_ledger import EventLedger
 from adk_runtime.memory_gate_p08 import P08MemoryGate, RuntimeSchema
 from adk_runtime.process.boot import boot
 from adk_runtime.persona_engine import load_persona
-from adk_runtime.observability import log_event, new_trace_id
-from adk_runtime.paths import RUNTIME_DATA_DIR, ensure_runtime_dirs
+from adk_runtime.observability import event_batch, log_event, new_trace_id
+from adk_runtime.paths import EVENTS_FILE, MEMORY_GATE_LEDGER_FILE, ensure_runtime_dirs
 from adk_runtime.trace_context import TraceContext
 
 import uuid
@@ -21,11 +21,22 @@ import uuid
 PROJECT_NAME = "p00-agent-os-mvp"
 SOURCE_TAG = PROJECT_NAME
 
+# Stub kernel 的固定 tool 调用：模块加载时建好一次；返回时复制成 list（payload / runtime.log 里仍是 list）。
+_STUB_TOOL_CALLS = (
+    {
+        "tool_name": "fake_search",
+        "args": {"q": "AI news this week"},
+    },
+)
+
+# 当前 stub kernel 不读 memory；接入真实 ADK 后需要时改为 True
+KERNEL_NEEDS_MEMORY = False
+
 
 def run_with_kernel(
     user_message: str,
     persona: Dict[str, Any],
-    memory: Dict[str, Any],
+    memory: Optional[Dict[str, Any]],
     session_id: str,
     trace_id: str,
 ) -> Dict[str, Any]:
@@ -47,16 +58,9 @@ def run_with_kernel(
     reply_text = f"[MVP Kernel Stub] You said: {user_message}"
 
     # 模拟：agent 决定调用一个 tool
-    tool_calls = [
-        {
-            "tool_name": "fake_search",
-            "args": {"q": "AI news this week"},
-        }
-    ]
-
     return {
         "reply": reply_text,
-        "tool_calls": tool_calls,
+        "tool_calls": list(_STUB_TOOL_CALLS),
         "debug": {
             "kernel": "stub",
             "session_id": session_id,
@@ -67,11 +71,11 @@ def run_with_kernel(
 
 def main() -> None:
     ensure_runtime_dirs()
-    ledger = EventLedger(RUNTIME_DATA_DIR / "events.jsonl")
-    boot_ctx = boot(ledger=ledger)
-    ledger = EventLedger(RUNTIME_DATA_DIR / "memory_gate_ledger.jsonl")
+    # EventLedger 只持有路径，append 时才打开文件（boot 用 events，P08 gate 用自己的账本）
+    boot_ctx = boot(ledger=EventLedger(EVENTS_FILE))
+    gate_ledger = EventLedger(MEMORY_GATE_LEDGER_FILE)
     runtime_schema = RuntimeSchema(supported_schema_version=1, supported_store_version=0)
-    memory_gate = P08MemoryGate(legacy_memory_store, ledger, runtime_schema)
+    memory_gate = P08MemoryGate(legacy_memory_store, gate_ledger, runtime_schema)
 
     session_id = f"p00-{uuid.uuid4()}"
     trace_id = new_trace_id()
@@ -83,123 +87,128 @@ def main() -> None:
 
     # 1) persona & memory
     persona = load_persona(user_id="susan")
-    memory = memory_gate.load_memory()
-
-    root_span_id, _ = ctx.new_span()
-    log_event(
-        event_type="session.start",
-        source=SOURCE_TAG,
-        payload={
-            "message": "Session started for p00 MVP",
-            "persona_user_id": persona.get("user_id"),
-        },
-        session_id=session_id,
-        trace_id=trace_id,
-        actor="runtime",
-        span_id=root_span_id,
-        parent_span_id=None,
-    )
-    
-
-    user_message = "Hello, this is the first OS-level MVP run."
-    user_span_id, _ = ctx.new_span()
-    log_event(
-        event_type="user.message",
-        source=SOURCE_TAG,
-        payload={"text": user_message},
-        session_id=session_id,
-        trace_id=trace_id,
-        actor="user",
-        span_id=user_span_id,
-        parent_span_id=root_span_id,
-    )
-
-    kernel_result = run_with_kernel(
-        user_message=user_message,
-        persona=persona,
-        memory=memory,
-        session_id=session_id,
-        trace_id=trace_id,
-    )
-
-    agent_span_id, _ = ctx.new_span()
-    log_event(
-        event_type="agent.reply",
-        source=SOURCE_TAG,
-        payload={
-            "reply": kernel_result.get("reply"),
-            "tool_calls": kernel_result.get("tool_calls", []),
-        },
-        session_id=session_id,
-        trace_id=trace_id,
-        actor="agent",
-        span_id=agent_span_id,
-        parent_span_id=user_span_id,
-    )
-
-    for call in kernel_result.get("tool_calls", []):
-        tool_span_id, _ = ctx.new_span()
+    persona_user_id = persona.get("user_id")
+    memory = memory_gate.load_memory() if KERNEL_NEEDS_MEMORY else None
+
+    # Session events are buffered and appended with one write per ledger at exit.
+    with event_batch():
+        root_span_id, _ = ctx.new_span()
         log_event(
-            event_type="tool.call",
+            event_type="session.start",
             source=SOURCE_TAG,
             payload={
-                "tool_name": call.get("tool_name"),
-                "args": call.get("args", {}),
+                "message": "Session started for p00 MVP",
+                "persona_user_id": persona_user_id,
             },
             session_id=session_id,
             trace_id=trace_id,
-            actor="tool",
-            span_id=tool_span_id,
-            parent_span_id=agent_span_id,
+            actor="runtime",
+            span_id=root_span_id,
+            parent_span_id=None,
+        )
+
+
+        user_message = "Hello, this is the first OS-level MVP run."
+        user_span_id, _ = ctx.new_span()
+        log_event(
+            event_type="user.message",
+            source=SOURCE_TAG,
+            payload={"text": user_message},
+            session_id=session_id,
+            trace_id=trace_id,
+            actor="user",
+            span_id=user_span_id,
+            parent_span_id=root_span_id,
         )
 
-        tool_output = {"ok": True, "data": "stub tool result"}
+        kernel_result = run_with_kernel(
+            user_message=user_message,
+            persona=persona,
+            memory=memory,
+            session_id=session_id,
+            trace_id=trace_id,
+        )
+
+        tool_calls = kernel_result.get("tool_calls", [])
 
-        tool_result_span_id, _ = ctx.new_span()
+        agent_span_id, _ = ctx.new_span()
         log_event(
-            event_type="tool.result",
+            event_type="agent.reply",
             source=SOURCE_TAG,
             payload={
-                "tool_name": call.get("tool_name"),
-                "result": tool_output,
+                "reply": kernel_result.get("reply"),
+                "tool_calls": tool_calls,
             },
             session_id=session_id,
             trace_id=trace_id,
-            actor="tool",
-            span_id=tool_result_span_id,
-            parent_span_id=tool_span_id,
+            actor="agent",
+            span_id=agent_span_id,
+            parent_span_id=user_span_id,
         )
 
-    # memory update (P07 allow-list: notes.* only)
-    persona_id = persona.get("user_id", "unknown")
-    result = memory_gate.save_memory(
-        {},
-        source="p00",
-        actor={"agent_id": "p00", "persona_id": persona_id},
-        # All new writes must use runtime.current schema_version; legacy versions are migration-only.
-        schema_version=runtime_schema.supported_schema_version,
-        zone="observation",
-        key=f"notes.session_{session_id}",
-        value={
-            "text": user_message,
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "trace_id": trace_id,
-        },
-    )
-    if result["status"] == "blocked":
-        print("WARNING: Memory write blocked by policy:", result["decision"]["reason"])
-
-    end_span_id, _ = ctx.new_span()
-    log_event(
-        event_type="session.end",
-        source=SOURCE_TAG,
-        payload={"message": "Session ended for p00 MVP"},
-        session_id=session_id,
-        trace_id=trace_id,
-        actor="runtime",
-        span_id=end_span_id,
-        parent_span_id=root_span_id,
-    )
+        for call in tool_calls:
+            tool_span_id, _ = ctx.new_span()
+            log_event(
+                event_type="tool.call",
+                source=SOURCE_TAG,
+                payload={
+                    "tool_name": call.get("tool_name"),
+                    "args": call.get("args", {}),
+                },
+                session_id=session_id,
+                trace_id=trace_id,
+                actor="tool",
+                span_id=tool_span_id,
+                parent_span_id=agent_span_id,
+            )
+
+            tool_output = {"ok": True, "data": "stub tool result"}
+
+            tool_result_span_id, _ = ctx.new_span()
+            log_event(
+                event_type="tool.result",
+                source=SOURCE_TAG,
+                payload={
+                    "tool_name": call.get("tool_name"),
+                    "result": tool_output,
+                },
+                session_id=session_id,
+                trace_id=trace_id,
+                actor="tool",
+                span_id=tool_result_span_id,
+                parent_span_id=tool_span_id,
+            )
+
+        # memory update (P07 allow-list: notes.* only)
+        persona_id = persona_user_id if persona_user_id is not None else "unknown"
+        result = memory_gate.save_memory(
+            {},
+            source="p00",
+            actor={"agent_id": "p00", "persona_id": persona_id},
+            # All new writes must use runtime.current schema_version; legacy versions are migration-only.
+            schema_version=runtime_schema.supported_schema_version,
+            zone="observation",
+            key=f"notes.session_{session_id}",
+            value={
+                "text": user_message,
+                "ts": datetime.now(timezone.utc).isoformat(),
+                "trace_id": trace_id,
+            },
+        )
+        if result["status"] == "blocked":
+            print("WARNING: Memory write blocked by policy:", result["decision"]["reason"])
+
+        end_span_id, _ = ctx.new_span()
+        log_event(
+            event_type="session.end",
+            source=SOURCE_TAG,
+            payload={"message": "Session ended for p00 MVP"},
+            session_id=session_id,
+            trace_id=trace_id,
+            actor="runtime",
+            span_id=end_span_id,
+            parent_span_id=root_span_id,
+        )
 
     print(kernel_result["reply"])
 
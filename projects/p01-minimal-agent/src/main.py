@@ -6,6 +6,17 @@
 from google import genai
 
 
+_client = None
+
+
+def _get_client() -> genai.Client:
+    # 同一进程内的 Agent 共用一个 Client（连接池 / 认证只初始化一次）
+    global _client
+    if _client is None:
+        _client = genai.Client()
+    return _client
+
+
 class MinimalAgent:
     """
     P01: 最小 Agent 细胞
@@ -20,7 +31,7 @@ class MinimalAgent:
         self.name = name
         self.instructions = instructions
         self.model = model
-        self.client = genai.Client()
+        self.client = _get_client()
 
     def ask_gemini(self, user_question: str) -> str:
         """
@@ -2,32 +2,37 @@ import time
 import uuid
 
 
-def now_ts():
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+def format_ts_ns(ts_ns: int) -> str:
+    # Local "%Y-%m-%d %H:%M:%S", computed from a stored time.time_ns() value.
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_ns // 1_000_000_000))
 
 
 class EventLedger:
     """
     A simple append-only event ledger.
-    Each event is a dict with:
+    self.events holds one (type, ts_ns, data) tuple per event:
     - type
-    - data
-    - timestamp
+    - ts_ns (time.time_ns() at add())
+    - data (the add() kwargs)
+    dump() returns them as dicts with type / timestamp / data.
     """
 
     def __init__(self):
         self.events = []
 
     def add(self, event_type: str, **kwargs):
-        event = {
-            "type": event_type,
-            "timestamp": now_ts(),
-            "data": kwargs,
-        }
-        self.events.append(event)
+        # Compact (type, ts_ns, data) tuple; dump() builds the dicts.
+        self.events.append((event_type, time.time_ns(), kwargs))
 
     def dump(self):
-        return self.events
+        return [
+            {
+                "type": event_type,
+                "timestamp": format_ts_ns(ts_ns),
+                "data": data,
+            }
+            for event_type, ts_ns, data in self.events
+        ]
 
 
 class Session:
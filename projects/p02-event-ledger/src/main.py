@@ -3,12 +3,23 @@ from event_ledger import Session
 import json
 
 
+_client = None
+
+
+def _get_client() -> genai.Client:
+    # 同一进程内的 Agent 共用一个 Client（连接池 / 认证只初始化一次）
+    global _client
+    if _client is None:
+        _client = genai.Client()
+    return _client
+
+
 class MinimalAgent:
     def __init__(self, name: str, instructions: str, model: str = "gemini-2.0-flash"):
         self.name = name
         self.instructions = instructions
         self.model = model
-        self.client = genai.Client()
+        self.client = _get_client()
 
     def ask_gemini(self, prompt: str) -> str:
         resp = self.client.models.generate_content(
@@ -4,6 +4,17 @@ import uuid
 import json
 
 
+_client = None
+
+
+def _get_client() -> genai.Client:
+    # 同一进程内的 Agent 共用一个 Client（连接池 / 认证只初始化一次）
+    global _client
+    if _client is None:
+        _client = genai.Client()
+    return _client
+
+
 # ------------------------------------------------------------
 # Minimal Agent (same as P01/P02, but extended with observer)
 # ------------------------------------------------------------
@@ -12,12 +23,12 @@ class MinimalAgent:
         self.name = name
         self.instructions = instructions
         self.model = model
-        self.client = genai.Client()
+        self.client = _get_client()
 
 
     def ask_gemini(self, prompt: str, observer: Observer):
         observer.trace(2, "Calling Gemini model")
-        observer.inc("tool_calls")
+        observer.inc(Observer.TOOL_CALLS)
 
         resp = self.client.models.generate_content(
             model=self.model,
@@ -37,7 +48,7 @@ class MinimalAgent:
             observer.log("Model returned successfully")
         except Exception as e:
             observer.log(f"Error: {str(e)}")
-            observer.inc("errors")
+            observer.inc(Observer.ERRORS)
             raise e
 
         observer.trace(3, "Returning final output")
@@ -1,43 +1,64 @@
 import time
+from array import array
 
 
-def now_ts():
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+def format_ts_ns(ts_ns: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_ns // 1_000_000_000))
 
 
 class Observer:
-    def __init__(self):
-        self.logs = []
-        self.traces = []
-        self.metrics = {
-            "total_events": 0,
-            "tool_calls": 0,
-            "errors": 0,
-            "execution_steps": 0,
-        }
+    # Metric slots in self._m (order matches _METRIC_KEYS)
+    TOTAL = 0
+    TOOL_CALLS = 1
+    ERRORS = 2
+    STEPS = 3
+    _METRIC_KEYS = ("total_events", "tool_calls", "errors", "execution_steps")
+
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
+        # Column storage: timestamps/steps in typed arrays, messages in lists.
+        # The "[LOG] ..." / "[TRACE] ..." strings are built by dump(), except
+        # log lines already printed in verbose mode, which are kept in _log_line.
+        self._log_ts = array("q")
+        self._log_msg: list[str] = []
+        self._log_line: list[str | None] = []
+        self._trace_step = array("i")
+        self._trace_msg: list[str] = []
+        self._m = array("q", [0, 0, 0, 0])
 
     # LOGGING -----------------------------------------------------
     def log(self, message: str):
-        entry = f"[LOG] {now_ts()} — {message}"
-        self.logs.append(entry)
-        print(entry)
+        ts_ns = time.time_ns()
+        self._log_ts.append(ts_ns)
+        self._log_msg.append(message)
+        line = None
+        if self.verbose:
+            line = f"[LOG] {format_ts_ns(ts_ns)} — {message}"
+            print(line)
+        self._log_line.append(line)
 
     # TRACING -----------------------------------------------------
     def trace(self, step: int, message: str):
-        entry = f"[TRACE] step {step}: {message}"
-        self.traces.append(entry)
-        print(entry)
-        self.metrics["execution_steps"] += 1
+        self._trace_step.append(step)
+        self._trace_msg.append(message)
+        if self.verbose:
+            print(f"[TRACE] step {step}: {message}")
+        self._m[Observer.STEPS] += 1
 
     # METRICS -----------------------------------------------------
-    def inc(self, key: str):
-        if key in self.metrics:
-            self.metrics[key] += 1
+    def inc(self, idx: int):
+        self._m[idx] += 1
 
     # FINAL EXPORT ------------------------------------------------
     def dump(self):
         return {
-            "logs": self.logs,
-            "traces": self.traces,
-            "metrics": self.metrics,
+            "logs": [
+                line if line is not None else f"[LOG] {format_ts_ns(ts)} — {msg}"
+                for ts, msg, line in zip(self._log_ts, self._log_msg, self._log_line)
+            ],
+            "traces": [
+                f"[TRACE] step {step}: {msg}"
+                for step, msg in zip(self._trace_step, self._trace_msg)
+            ],
+            "metrics": dict(zip(self._METRIC_KEYS, self._m)),
         }
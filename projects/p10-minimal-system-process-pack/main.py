@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import json
 from pathlib import Path
+from typing import Iterator
 
 # Ensure repo root is on PYTHONPATH so `import adk_runtime` works.
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -14,32 +15,50 @@ from adk_runtime.event_ledger import EventLedger
 from adk_runtime.process import boot
 from adk_runtime.process.lifecycle import shutdown
 
+_TAIL_BLOCK = 64 * 1024
+
+
+def _iter_lines_reversed(path: Path, block: int = _TAIL_BLOCK) -> Iterator[bytes]:
+    # Yield raw lines last-to-first, reading the file backwards in fixed blocks.
+    with path.open("rb") as f:
+        pos = f.seek(0, 2)
+        tail = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        yield tail
+
+
 def _detect_unclosed_run(events_path: Path) -> str | None:
+    """
+    Same rule as boot._get_last_run_status: the last system.boot is unclosed
+    if no system.shutdown for its run_id follows. Scans from the tail and
+    stops at that boot, parsing only boot/shutdown lines.
+    """
     if not events_path.exists():
         return None
-    boots: list[str] = []
     shutdowns: set[str] = set()
-    with events_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                ev = json.loads(line)
-            except Exception:
-                continue
-            et = ev.get("event_type")
-            payload = ev.get("payload") or {}
-            rid = payload.get("run_id") or ev.get("run_id")
-            if not rid:
-                continue
-            if et == "system.boot":
-                boots.append(rid)
-            elif et == "system.shutdown":
-                shutdowns.add(rid)
-    for rid in reversed(boots):
-        if rid not in shutdowns:
-            return rid
+    for line in _iter_lines_reversed(events_path):
+        if b"system.boot" not in line and b"system.shutdown" not in line:
+            continue
+        try:
+            ev = json.loads(line)
+        except Exception:
+            continue
+        et = ev.get("event_type")
+        payload = ev.get("payload") or {}
+        rid = payload.get("run_id") or ev.get("run_id")
+        if not rid:
+            continue
+        if et == "system.shutdown":
+            shutdowns.add(rid)
+        elif et == "system.boot":
+            return None if rid in shutdowns else rid
     return None
 
 
@@ -32,10 +32,11 @@ async def ask_agent(runner: Runner, message: str) -> str:
         session_id=SESSION_ID,
         new_message=content,
     ):
-        if event.is_final_response():
-            if event.content and event.content.parts:
-                final_text = event.content.parts[0].text
-            break
+        if not event.is_final_response():
+            continue
+        if event.content and event.content.parts:
+            final_text = event.content.parts[0].text
+        break
 
     print(f"AI[{SESSION_ID}]   > {final_text}")
     return final_text
@@ -83,6 +84,8 @@ async def main() -> None:
         session_id=SESSION_ID,
     )
 
+    # 先收集再一次性输出 — Collect lines, then write them in one go
+    lines = []
     for idx, event in enumerate(session.events):
         author = event.author
         content = event.content
@@ -94,7 +97,10 @@ async def main() -> None:
             # 部分版本里 text 在 part0.text — Some versions store text in part0.text
             text = getattr(part0, "text", "")
 
-        print(f"- [{idx}] {author}: {text}")
+        lines.append(f"- [{idx}] {author}: {text}")
+
+    if lines:
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -8,14 +8,16 @@ This script demonstrates:
 """
 
 import asyncio
+import json
 import sqlite3
-import os
+from pathlib import Path
 
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
 from google.adk.sessions import DatabaseSessionService
 from google.adk.runners import Runner
 from google.genai import types
+from sqlalchemy import event
 
 # -------------------------
 # 🔧 Global Constants
@@ -26,12 +28,95 @@ APP_NAME = "agents"
 USER_ID = "susan"
 
 # Compute PROJECT_ROOT = adk-decade-of-agents/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-DB_PATH = os.path.join(PROJECT_ROOT, "day3_sessions.db")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DB_PATH = PROJECT_ROOT / "day3_sessions.db"
 
 # Async SQLAlchemy driver + absolute path
 DB_URL = f"sqlite+aiosqlite:///{DB_PATH}"
 
+# Seconds a sqlite3 connection waits on a locked DB before raising
+SQLITE_TIMEOUT = 5.0
+
+# Per-connection settings; unlike journal_mode they are not stored in the file,
+# so they are applied to every connection the session engine opens.
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # WAL: fsync at checkpoint, not on every commit
+    f"PRAGMA busy_timeout={int(SQLITE_TIMEOUT * 1000)}",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def enable_wal(db_path: Path) -> None:
+    """
+    Switch the DB file to WAL once at startup.
+    journal_mode=WAL is persistent on the file, so the aiosqlite connections
+    opened by DatabaseSessionService pick it up as well: readers no longer
+    block on the writer and each commit is a WAL append, not a rollback-journal cycle.
+    """
+    conn = sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+def tune_session_engine(session_service: DatabaseSessionService) -> None:
+    """Apply SQLITE_CONNECTION_PRAGMAS to each new connection of the service's engine."""
+    engine = session_service.db_engine
+
+    # AsyncEngine exposes its pool events on .sync_engine
+    @event.listens_for(getattr(engine, "sync_engine", engine), "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+# Only the columns the raw dump prints: author + parts[0].text pulled out by
+# SQLite (JSON1). Same rules as _decode_content and as P13's inspector:
+# parts[0].text if parts[0] is an object, otherwise the raw content column.
+_EVENTS_SQL = """
+    SELECT author,
+           CASE WHEN json_valid(content) AND json_type(content, '$.parts[0]') = 'object'
+                THEN COALESCE(json_extract(content, '$.parts[0].text'), '')
+                ELSE content
+           END
+    FROM events
+    WHERE session_id = ?
+    ORDER BY timestamp
+"""
+
+# Fallback when SQLite is built without JSON1: decode in Python.
+_EVENTS_SQL_RAW = """
+    SELECT author, content
+    FROM events
+    WHERE session_id = ?
+    ORDER BY timestamp
+"""
+
+
+def _decode_content(content_json):
+    try:
+        content = json.loads(content_json)
+        text = content["parts"][0].get("text")
+        # Missing or JSON null -> "", same as COALESCE(..., '') in _EVENTS_SQL
+        return "" if text is None else text
+    except Exception:
+        return content_json
+
+
+def iter_events(conn: sqlite3.Connection, session_id: str) -> list:
+    """Return (author, text) rows for one session in timestamp order."""
+    try:
+        return conn.execute(_EVENTS_SQL, (session_id,)).fetchall()
+    except sqlite3.OperationalError:
+        rows = conn.execute(_EVENTS_SQL_RAW, (session_id,))
+        return [(author, _decode_content(c)) for author, c in rows]
+
 
 # -------------------------
 # 🔧 Main Logic
@@ -47,8 +132,13 @@ async def main() -> None:
         description="Agent with SQLite-backed persistent sessions.",
     )
 
-    # 2. Session service uses SQLite (persistent)
-    session_service = DatabaseSessionService(db_url=DB_URL)
+    # 2. Session service uses SQLite (persistent, WAL)
+    enable_wal(DB_PATH)
+    session_service = DatabaseSessionService(
+        db_url=DB_URL,
+        connect_args={"timeout": SQLITE_TIMEOUT},
+    )
+    tune_session_engine(session_service)
 
     # 3. Runner
     runner = Runner(
@@ -60,19 +150,21 @@ async def main() -> None:
     session_id = "db-demo-session"
 
     # 4. Create or reuse persistent session
-    try:
+    # get_session returns None on a miss, so probe first instead of letting
+    # create_session fail on the duplicate key.
+    existing = await session_service.get_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=session_id,
+    )
+    if existing is None:
         await session_service.create_session(
             app_name=APP_NAME,
             user_id=USER_ID,
             session_id=session_id,
         )
         print(f"✅ Created new persistent session: {session_id}")
-    except Exception:
-        await session_service.get_session(
-            app_name=APP_NAME,
-            user_id=USER_ID,
-            session_id=session_id,
-        )
+    else:
         print(f"♻️ Reusing existing persistent session: {session_id}")
 
     # 5. Send messages
@@ -103,30 +195,26 @@ async def main() -> None:
     )
 
     print("\n--- SESSION EVENTS (from DatabaseSessionService) ---")
+    lines = []
     for idx, e in enumerate(session.events):
         content = ""
         if e.content and getattr(e.content, "parts", None):
             content = e.content.parts[0].text
-        print(f"- [{idx}] {e.author}: {content}")
+        lines.append(f"- [{idx}] {e.author}: {content}")
+    if lines:
+        print("\n".join(lines))
 
     # 7. Raw DB inspection via sqlite3
     print("\n--- RAW DB EVENTS (sqlite3) ---")
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT app_name, session_id, author, content
-            FROM events
-            WHERE session_id = ?
-            ORDER BY id
-            """,
-            (session_id,),
-        )
-        rows = cursor.fetchall()
-        for row in rows:
-            print(row)
-        conn.close()
+        # Read-only: the events schema belongs to DatabaseSessionService.
+        conn = sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True, timeout=SQLITE_TIMEOUT)
+        try:
+            rows = iter_events(conn, session_id)
+            if rows:
+                print("\n".join(f"{author}: {text}" for author, text in rows))
+        finally:
+            conn.close()
     except Exception as e:
         print(f"⚠️ Failed to inspect SQLite DB: {e}")
 
@@ -5,66 +5,95 @@ Reads the SQLite ledger created by P12 and prints all events.
 """
 
 import sqlite3
+from contextlib import closing
 import json
-import os
+from pathlib import Path
 
 # Compute PROJECT_ROOT = adk-decade-of-agents/
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-DB_PATH = os.path.join(PROJECT_ROOT, "day3_sessions.db")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DB_PATH = PROJECT_ROOT / "day3_sessions.db"
+
+
+# Text is pulled out inside SQLite (JSON1). Same rules as _decode_content:
+# parts[0].text if parts[0] is an object, otherwise the raw content column.
+_EVENTS_SQL = """
+    SELECT app_name, session_id, author,
+           CASE WHEN json_valid(content) AND json_type(content, '$.parts[0]') = 'object'
+                THEN COALESCE(json_extract(content, '$.parts[0].text'), '')
+                ELSE content
+           END,
+           timestamp
+    FROM events
+    ORDER BY timestamp ASC
+"""
 
+# Fallback when SQLite is built without JSON1: decode in Python.
+_EVENTS_SQL_RAW = """
+    SELECT app_name, session_id, author, content, timestamp
+    FROM events
+    ORDER BY timestamp ASC
+"""
 
-def pretty_print_event(row):
-    app, session_id, author, content_json, timestamp = row
 
+def _decode_content(content_json):
     try:
         content = json.loads(content_json)
-        text = content["parts"][0].get("text", "")
+        text = content["parts"][0].get("text")
+        # Missing or JSON null -> "", same as COALESCE(..., '') in _EVENTS_SQL
+        return "" if text is None else text
     except Exception:
-        text = content_json
+        return content_json
+
+
+def iter_events(conn):
+    """Yield (app, session_id, author, text, timestamp) rows in timestamp order."""
+    try:
+        return conn.execute(_EVENTS_SQL)
+    except sqlite3.OperationalError:
+        rows = conn.execute(_EVENTS_SQL_RAW)
+        return ((app, sid, author, _decode_content(c), ts) for app, sid, author, c, ts in rows)
+
 
-    print("────────────────────────────────────────────")
-    print(f"Session : {session_id}")
-    print(f"Author  : {author}")
-    print(f"Time    : {timestamp}")
-    print(f"Text    : {text}")
+def pretty_print_event(row):
+    app, session_id, author, text, timestamp = row
+
+    # One print (one stdout write) per event instead of five
+    print(
+        "────────────────────────────────────────────\n"
+        f"Session : {session_id}\n"
+        f"Author  : {author}\n"
+        f"Time    : {timestamp}\n"
+        f"Text    : {text}"
+    )
 
 
 def main():
     print("📘 P13 — DB Inspector running...")
     print(f"Looking for DB at: {DB_PATH}")
 
-    if not os.path.exists(DB_PATH):
+    if not DB_PATH.exists():
         print("❌ ERROR: day3_sessions.db not found.")
         print("   Please run P12 first.")
         return
 
+    # Read-only URI: the inspector never writes, so it can run alongside P12.
+    # Rows stream straight off the cursor instead of fetchall() into memory.
+    # ORDER BY stays on timestamp: ADK's events.id is a string UUID, not a rowid.
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT app_name, session_id, author, content, timestamp
-            FROM events
-            ORDER BY timestamp ASC
-            """
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with closing(sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True)) as conn:
+            (total,) = conn.execute("SELECT COUNT(*) FROM events").fetchone()
+            if not total:
+                print("⚠️ Database exists but has no events.")
+                return
 
+            print(f"\n📦 Found {total} events:\n")
+
+            for row in iter_events(conn):
+                pretty_print_event(row)
     except Exception as e:
         print(f"❌ Failed to read database: {e}")
         return
 
-    if not rows:
-        print("⚠️ Database exists but has no events.")
-        return
-
-    print(f"\n📦 Found {len(rows)} events:\n")
-
-    for row in rows:
-        pretty_print_event(row)
-
     print("\n🔍 DB Inspector finished.\n")
 
 
@@ -11,10 +11,13 @@ Goal:
 from __future__ import annotations
 
 import asyncio
+import os
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
-USE_MOCK = True  # 默认使用 Mock，避免真实 LLM 依赖；设置为 False 可恢复原 ADK 路径
+# 默认使用 Mock，避免真实 LLM 依赖；P14_MOCK=0 切换到原 ADK 路径（无需改代码）
+USE_MOCK = os.environ.get("P14_MOCK", "1") == "1"
 
 if not USE_MOCK:
     from google.adk.agents import LlmAgent
@@ -29,7 +32,7 @@ USER_ID = "susan"
 
 
 # -------------------- Mock Runner --------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockEvent:
     session_id: str
     role: str
@@ -39,7 +42,7 @@ class MockEvent:
 class MockSession:
     def __init__(self, session_id: str) -> None:
         self.session_id = session_id
-        self.events: List[MockEvent] = []
+        self.events: deque[MockEvent] = deque()
 
 
 class MockSessionService:
@@ -56,19 +59,20 @@ class MockSessionService:
 class MockRunner:
     """
     Minimal deterministic mock runner for session isolation regression.
-    Per-session history is isolated by session_id.
+    Per-session turn counters are isolated by session_id
+    (message text is kept only in session.events).
     """
 
     def __init__(self, session_service: MockSessionService) -> None:
         self.session_service = session_service
-        self.history: Dict[str, List[str]] = {}
+        self.turn_counts: Dict[str, int] = {}
 
     async def run_async(self, *, session_id: str, user_text: str, **kwargs: Any) -> AsyncGenerator[MockEvent, None]:
-        hist = self.history.setdefault(session_id, [])
-        hist.append(user_text)
+        turn = self.turn_counts.get(session_id, 0) + 1
+        self.turn_counts[session_id] = turn
 
         user_event = MockEvent(session_id=session_id, role="user", text=user_text)
-        reply = f"[MOCK][{session_id}] turn={len(hist)} echo: {user_text}"
+        reply = f"[MOCK][{session_id}] turn={turn} echo: {user_text}"
         assistant_event = MockEvent(session_id=session_id, role="assistant", text=reply)
 
         # Persist into session events list for later inspection
@@ -100,6 +104,13 @@ async def send_one(runner: Any, session_id: str, query: str) -> None:
                 print(f"{MODEL_NAME}[{session_id}] > {text}")
 
 
+def print_events(events: Any) -> None:
+    """Print a session's events with a single write."""
+    lines = [f"- [{idx}] {e.role}[{e.session_id}]: {getattr(e, 'text', '')}" for idx, e in enumerate(events)]
+    if lines:
+        print("\n".join(lines))
+
+
 # -------------------- Main --------------------
 async def main() -> None:
     print("✅ P14 — session_isolation_test: main() starting")
@@ -135,13 +146,11 @@ async def main() -> None:
     # ---------- Print events for both sessions ----------
     print("\n--- SESSION A EVENTS ---")
     session_A_data = await session_service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=sessionA)
-    for idx, e in enumerate(session_A_data.events):
-        print(f"- [{idx}] {e.role}[{e.session_id}]: {getattr(e, 'text', '')}")
+    print_events(session_A_data.events)
 
     print("\n--- SESSION B EVENTS ---")
     session_B_data = await session_service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=sessionB)
-    for idx, e in enumerate(session_B_data.events):
-        print(f"- [{idx}] {e.role}[{e.session_id}]: {getattr(e, 'text', '')}")
+    print_events(session_B_data.events)
 
     print("\n✅ Session Isolation Test finished.")
 
@@ -34,6 +34,26 @@ async def send_one(runner: Runner, session_id: str, query: str):
                 print(f"{MODEL_NAME}[{session_id}] > {msg}")
 
 
+def _extract_summary(compacted) -> str:
+    """Summary text from compacted_content (Content object, dict, or anything else)."""
+    # Case 1: Content object — one attribute access on the common path
+    try:
+        parts = compacted.parts
+    except AttributeError:
+        pass
+    else:
+        return (parts[0].text or "") if parts and hasattr(parts[0], "text") else ""
+
+    # Case 2: dict format
+    if isinstance(compacted, dict):
+        parts = compacted.get("parts", [])
+        if parts and isinstance(parts[0], dict):
+            return parts[0].get("text", "")
+        return ""
+
+    return str(compacted)
+
+
 async def main():
     print("🚀 P15 — compaction_demo: starting")
 
@@ -89,34 +109,21 @@ async def main():
 
     found = False
 
-    for event in session.events:
-        if event.actions and event.actions.compaction:
-            found = True
-            print("\n🎉 Compaction event detected!\n")
-
-            comp = event.actions.compaction
-            compacted = getattr(comp, "compacted_content", None)
-
-            summary_text = ""
-
-            # Case 1: Content object
-            if hasattr(compacted, "parts"):
-                parts = compacted.parts
-                if parts and hasattr(parts[0], "text"):
-                    summary_text = parts[0].text
+    # Compaction events are appended late in the timeline: scan from the end.
+    for event in reversed(session.events):
+        actions = event.actions
+        if not actions or not actions.compaction:
+            continue
 
-            # Case 2: dict format
-            elif isinstance(compacted, dict):
-                parts = compacted.get("parts", [])
-                if parts and isinstance(parts[0], dict):
-                    summary_text = parts[0].get("text", "")
+        found = True
+        print("\n🎉 Compaction event detected!\n")
 
-            else:
-                summary_text = str(compacted)
+        compacted = getattr(actions.compaction, "compacted_content", None)
+        summary_text = _extract_summary(compacted)
 
-            print("📝 Summary Content:\n")
-            print(summary_text[:800] + ("..." if len(summary_text) > 800 else ""))
-            break
+        print("📝 Summary Content:\n")
+        print(summary_text[:800] + ("..." if len(summary_text) > 800 else ""))
+        break
 
     if not found:
         print("⚠️ No compaction event found — try more messages.")
@@ -71,10 +71,9 @@ SYSTEM_INSTRUCTION = (
 def load_memory_store() -> Dict[str, Any]:
     if MEMORY_FILE.exists():
         try:
-            with MEMORY_FILE.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+            data = json.loads(MEMORY_FILE.read_bytes())
+            if isinstance(data, dict):
+                return data
         except Exception as e:
             print("⚠️ 读取 memory_store.json 失败，将使用空结构 (Failed to read memory_store.json; using empty structure):", repr(e))
     return {"conversation_summaries": []}
@@ -82,8 +81,7 @@ def load_memory_store() -> Dict[str, Any]:
 
 def save_memory_store(data: Dict[str, Any]) -> None:
     MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with MEMORY_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    MEMORY_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"💾 已写入 memory_store.json (memory_store.json written) -> {MEMORY_FILE}")
 
 
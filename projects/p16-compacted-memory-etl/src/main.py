@@ -45,10 +45,9 @@ def load_memory_store() -> Dict[str, Any]:
     """读取 memory_store.json，没有就返回初始化结构。Read memory_store.json; return the default structure if missing."""
     if MEMORY_FILE.exists():
         try:
-            with MEMORY_FILE.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+            data = json.loads(MEMORY_FILE.read_bytes())
+            if isinstance(data, dict):
+                return data
         except Exception as e:
             print("⚠️ 读取 memory_store.json 失败（Failed to read memory_store.json），将使用空结构：", repr(e))
 
@@ -60,8 +59,7 @@ def load_memory_store() -> Dict[str, Any]:
 def save_memory_store(data: Dict[str, Any]) -> None:
     """写回 memory_store.json。Write updated data back to memory_store.json."""
     MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with MEMORY_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    MEMORY_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"💾 已写入 memory_store.json（saved to memory_store.json） -> {MEMORY_FILE}")
 
 
@@ -87,13 +87,12 @@ def load_legacy_memory() -> Dict[str, Any]:
         return {}
 
     try:
-        with LEGACY_MEMORY_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                print("✅ Legacy memory loaded successfully.")
-                return data
-            print("⚠️ Legacy memory is not a dict. Using empty legacy structure.")
-            return {}
+        data = json.loads(LEGACY_MEMORY_FILE.read_bytes())
+        if isinstance(data, dict):
+            print("✅ Legacy memory loaded successfully.")
+            return data
+        print("⚠️ Legacy memory is not a dict. Using empty legacy structure.")
+        return {}
     except Exception as e:
         print("⚠️ Failed to read legacy memory. Using empty legacy structure:", repr(e))
         return {}
@@ -104,8 +103,7 @@ def save_memory_v1(memory_v1: Dict[str, Any]) -> None:
     将 Schema v1 结构写回 memory_store.json（就地覆盖）。
     """
     MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with MEMORY_FILE.open("w", encoding="utf-8") as f:
-        json.dump(memory_v1, f, ensure_ascii=False, indent=2)
+    MEMORY_FILE.write_text(json.dumps(memory_v1, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"💾 Saved Memory Schema v1 to: {MEMORY_FILE}")
 
 
@@ -9,6 +9,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Set
 
 
+# tool.call must be closed by one of these child events (P05 v1)
+_TOOL_OUTCOME_EVENTS = frozenset(("tool.result", "tool.error"))
+
+
 def canonical_json(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
@@ -238,7 +242,7 @@ def replay_and_validate(events: List[Event], strict: bool = False) -> Dict[str,
         if ev.event_type == "tool.call":
             tool_calls.append(sid)
             kids = _children_of(children, sid)
-            ok = any(span2event[k].event_type in ("tool.result", "tool.error") for k in kids)
+            ok = any(span2event[k].event_type in _TOOL_OUTCOME_EVENTS for k in kids)
             if not ok:
                 errors.append(f"tool.call missing tool.result/tool.error child: span_id={sid}")
         elif ev.event_type == "tool.result":
@@ -293,6 +297,48 @@ def replay_and_validate(events: List[Event], strict: bool = False) -> Dict[str,
     return report
 
 
+class ReportStream:
+    """
+    Writes the replay report one session at a time, so only the current
+    session's report is held in memory. Output is identical to dumping
+    the full payload at once:
+      - single session -> the report object
+      - multiple sessions -> {"reports": [...]}
+    The file is written to "<out>.part" and renamed on close, so a failed
+    (e.g. --strict) run never leaves a truncated report behind.
+    """
+
+    def __init__(self, out_path: Path, multi: bool):
+        self.out_path = out_path
+        self.multi = multi
+        self.tmp_path = out_path.with_name(out_path.name + ".part")
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self.tmp_path.open("w", encoding="utf-8")
+        self._count = 0
+        if multi:
+            self._f.write('{\n  "reports": [\n')
+
+    def write(self, report: Dict[str, Any]) -> None:
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if self.multi:
+            if self._count:
+                self._f.write(",\n")
+            text = "\n".join("    " + line for line in text.split("\n"))
+        self._f.write(text)
+        self._count += 1
+
+    def close(self) -> None:
+        if self.multi:
+            self._f.write("\n  ]\n}")
+        self._f.write("\n")
+        self._f.close()
+        self.tmp_path.replace(self.out_path)
+
+    def abort(self) -> None:
+        self._f.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="P06 Replay Runner (hardened)")
     ap.add_argument("--file", default="runtime_data/events.jsonl", help="Path to events.jsonl")
@@ -317,35 +363,38 @@ def main() -> None:
     if not sessions:
         raise SystemExit("[ERROR] No sessions found (check --session filter or file).")
 
-    all_reports: List[Dict[str, Any]] = []
-    for sid, evs in sorted(sessions.items(), key=lambda kv: kv[0]):
-        evs.sort(key=lambda e: (e.ts, e.event_type))
-        report = replay_and_validate(evs, strict=args.strict)
-        all_reports.append(report)
-
-        print("\n" + "=" * 88)
-        print(f"REPLAY SESSION: {sid}")
-        print(f"TRACE_IDS: {report['trace_ids']}")
-        print(f"EVENTS: {report['event_count']}")
-        if report["warnings"]:
-            print("\nWARNINGS:")
-            for w in report["warnings"]:
-                print(" -", w)
-        if report["errors"]:
-            print("\nERRORS:")
-            for e in report["errors"]:
-                print(" -", e)
-
-        print("\nREPLAY OUTPUT:")
-        for line in report["replay_lines"]:
-            print(line)
-
-    if args.out:
-        out_path = Path(args.out)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"reports": all_reports} if len(all_reports) > 1 else all_reports[0]
-        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        print(f"\nWrote replay report: {out_path}")
+    stream = ReportStream(Path(args.out), multi=len(sessions) > 1) if args.out else None
+    try:
+        for sid, evs in sorted(sessions.items(), key=lambda kv: kv[0]):
+            evs.sort(key=lambda e: (e.ts, e.event_type))
+            report = replay_and_validate(evs, strict=args.strict)
+            if stream is not None:
+                stream.write(report)
+
+            print("\n" + "=" * 88)
+            print(f"REPLAY SESSION: {sid}")
+            print(f"TRACE_IDS: {report['trace_ids']}")
+            print(f"EVENTS: {report['event_count']}")
+            if report["warnings"]:
+                print("\nWARNINGS:")
+                for w in report["warnings"]:
+                    print(" -", w)
+            if report["errors"]:
+                print("\nERRORS:")
+                for e in report["errors"]:
+                    print(" -", e)
+
+            print("\nREPLAY OUTPUT:")
+            for line in report["replay_lines"]:
+                print(line)
+    except BaseException:
+        if stream is not None:
+            stream.abort()
+        raise
+
+    if stream is not None:
+        stream.close()
+        print(f"\nWrote replay report: {stream.out_path}")
 
     print("\nDone.")
 
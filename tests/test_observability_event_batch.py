@@ -0,0 +1,86 @@
+# tests/test_observability_event_batch.py
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from adk_runtime import observability
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    """Point emit_event at a temp ledger and count append-mode opens of it."""
+    path = tmp_path / "observability_events.jsonl"
+    monkeypatch.setattr(observability, "OBS_DIR", tmp_path)
+    monkeypatch.setattr(observability, "OBS_EVENTS_FILE", path)
+
+    opens = []
+    real_open = Path.open
+
+    def counting_open(self, mode="r", *args, **kwargs):
+        if self == path and "a" in mode:
+            opens.append(mode)
+        return real_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    return path, opens
+
+
+def _emit(n: int) -> None:
+    observability.emit_event("tool.call", "run_batch_test", payload={"n": n})
+
+
+def _ns(path: Path) -> list[int]:
+    return [json.loads(line)["payload"]["n"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_event_batch_keeps_order_and_writes_once(ledger):
+    path, opens = ledger
+    with observability.event_batch():
+        for n in range(5):
+            _emit(n)
+        assert not path.exists(), "lines must stay buffered until the batch exits"
+    assert _ns(path) == [0, 1, 2, 3, 4]
+    assert len(opens) == 1
+
+
+def test_event_batch_flushes_when_block_raises(ledger):
+    path, _ = ledger
+    with pytest.raises(RuntimeError, match="boom"):
+        with observability.event_batch():
+            _emit(0)
+            _emit(1)
+            raise RuntimeError("boom")
+    assert _ns(path) == [0, 1]
+
+
+def test_nested_event_batch_joins_outer(ledger):
+    path, opens = ledger
+    with observability.event_batch():
+        _emit(0)
+        with observability.event_batch():
+            _emit(1)
+        assert not path.exists(), "inner batch must not flush on its own"
+        _emit(2)
+    assert _ns(path) == [0, 1, 2]
+    assert len(opens) == 1
+
+
+def test_flush_error_does_not_mask_block_error(ledger):
+    path, _ = ledger
+    # Directory in place of the ledger file: the flush open() itself fails.
+    path.mkdir()
+    with pytest.raises(RuntimeError, match="original"):
+        with observability.event_batch():
+            _emit(0)
+            raise RuntimeError("original")
+
+
+def test_flush_error_raises_when_block_succeeds(ledger):
+    path, _ = ledger
+    path.mkdir()
+    with pytest.raises(OSError):
+        with observability.event_batch():
+            _emit(0)